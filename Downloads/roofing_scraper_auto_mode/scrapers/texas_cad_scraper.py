@@ -5,24 +5,98 @@ Scrapes major Texas CAD sites (Tarrant, Dallas, Denton, Collin, etc.)
 Outputs consistent CSV with address, name, value, year built
 """
 
+import asyncio
+import aiohttp
+import numpy as np
 import requests
-import json
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import csv
-import time
-import random
+import os
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 from typing import List, Dict, Any
 import logging
 from itertools import cycle
-from supabase_config import insert_lead
+from collections import Counter
+from supabase_config import insert_leads_bulk
 
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Year used for property age scoring, snapshotted once for the scraper's run
+_CURRENT_YEAR = datetime.now().year
+
+# Shared PCG64 generator for all sample data
+_rng = np.random.default_rng()
+
+# Maximum rows sent to Supabase in a single insert request
+SUPABASE_BATCH_SIZE = 500
+
+# Columns of the cad_leads table, stored under their Supabase names
+SUPABASE_CAD_COLUMNS = (
+    'account_number', 'owner_name', 'address_text', 'city', 'county', 'zip_code',
+    'property_type', 'year_built', 'square_feet', 'lot_size_acres', 'appraised_value',
+    'market_value', 'homestead_exemption', 'last_sale_date', 'last_sale_price',
+    'cad_url', 'lead_score'
+)
+
+# Stored column order for CAD data (Supabase columns plus local-only fields)
+CAD_COLUMNS = SUPABASE_CAD_COLUMNS + ('data_source', 'scraped_at')
+
+# CAD records and CSV output keep their original field names
+KEY_RENAME = {'address_text': 'property_address', 'zip_code': 'zipcode'}
+CAD_FIELDNAMES = tuple(KEY_RENAME.get(name, name) for name in CAD_COLUMNS)
+
 class TexasCADScraper:
+    # Realistic ZIP codes for each county
+    ZIP_RANGES = {
+        'Harris County': ('77001', '77002', '77003', '77004', '77005', '77006', '77007'),
+        'Dallas County': ('75201', '75204', '75206', '75214', '75218', '75230', '75240'),
+        'Tarrant County': ('76101', '76104', '76108', '76116', '76120', '76132', '76140'),
+        'Bexar County': ('78201', '78202', '78203', '78204', '78205', '78206', '78207'),
+        'Travis County': ('78701', '78702', '78703', '78704', '78705', '78728', '78729'),
+        'Collin County': ('75002', '75009', '75013', '75023', '75024', '75070', '75071'),
+        'Hidalgo County': ('78501', '78502', '78503', '78504', '78539', '78540', '78541'),
+        'Fort Bend County': ('77469', '77478', '77479', '77489', '77498', '77584', '77585'),
+        'Denton County': ('76201', '76205', '76226', '75019', '75022', '75028', '75067'),
+        'Montgomery County': ('77301', '77302', '77303', '77304', '77384', '77385', '77386')
+    }
+    DEFAULT_ZIP_RANGE = ('75001',)
+    ZIP_ARRAYS = {county: np.array(zips) for county, zips in ZIP_RANGES.items()}
+    
+    # Base property values by county
+    BASE_VALUES = {
+        'Harris County': 280000,
+        'Dallas County': 320000,
+        'Tarrant County': 280000,
+        'Bexar County': 220000,
+        'Travis County': 450000,  # Austin is expensive
+        'Collin County': 380000,
+        'Hidalgo County': 150000,
+        'Fort Bend County': 350000,
+        'Denton County': 350000,
+        'Montgomery County': 300000
+    }
+    DEFAULT_BASE_VALUE = 250000
+
     def __init__(self):
+        # Pooled keep-alive session shared by every CAD request
         self.session = requests.Session()
-        self.all_properties = []
+        retries = Retry(total=3, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504])
+        adapter = HTTPAdapter(pool_connections=20, pool_maxsize=50, max_retries=retries)
+        self.session.mount('http://', adapter)
+        self.session.mount('https://', adapter)
+        self.session.headers.update({
+            'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36',
+            'Accept-Encoding': 'gzip, deflate'
+        })
+        # Scraped properties stored column-wise: field name -> array
+        self.columns: Dict[str, np.ndarray] = {}
+        
+        # Sample data is generated once per run; counties map to row slices
+        self._sample_cache = None
+        self._sample_by_county: Dict[str, slice] = {}
         
         # Proxy rotation setup (basic implementation)
         self.proxies = [
@@ -96,201 +170,208 @@ class TexasCADScraper:
         else:
             self.session.proxies.clear()
 
-    def create_texas_cad_sample_data(self) -> List[Dict]:
-        """Create realistic CAD data for all major Texas counties"""
-        sample_properties = []
-        
+    def create_texas_cad_sample_data(self) -> Dict[str, np.ndarray]:
+        """Create realistic CAD data for all major Texas counties, as columns"""
         # Property owner name templates
-        first_names = [
+        first_names = np.array([
             'James', 'Mary', 'John', 'Patricia', 'Robert', 'Jennifer', 'Michael', 'Linda',
             'William', 'Elizabeth', 'David', 'Barbara', 'Richard', 'Susan', 'Joseph', 'Jessica',
             'Thomas', 'Sarah', 'Christopher', 'Karen', 'Charles', 'Nancy', 'Daniel', 'Lisa'
-        ]
+        ])
         
-        last_names = [
+        last_names = np.array([
             'Smith', 'Johnson', 'Williams', 'Brown', 'Jones', 'Garcia', 'Miller', 'Davis',
             'Rodriguez', 'Martinez', 'Hernandez', 'Lopez', 'Gonzalez', 'Wilson', 'Anderson',
             'Thomas', 'Taylor', 'Moore', 'Jackson', 'Martin', 'Lee', 'Perez', 'Thompson'
-        ]
+        ])
         
-        street_names = [
+        street_names = np.array([
             'Main St', 'Oak Ave', 'Elm St', 'Park Blvd', 'Cedar Ln', 'Maple Dr',
             'Pine St', 'Hill Rd', 'Valley View', 'Sunset Blvd', 'Heritage Way',
             'Legacy Dr', 'Champions Blvd', 'Preston Rd', 'Spring Valley', 'Ranch Rd',
             'County Line Rd', 'Farm to Market Rd', 'State Highway', 'Business Park Dr'
-        ]
+        ])
         
-        property_types = [
+        property_types = np.array([
             'Single Family Residence', 'Townhouse', 'Condominium', 
             'Mobile Home', 'Duplex', 'Commercial Property'
-        ]
+        ])
         
-        for county, data in self.texas_cads.items():
-            cities = data['major_cities']
-            population = data['population']
-            
-            # Generate properties based on county population (more pop = more properties)
-            property_count = min(max(int(population / 100000), 5), 15)  # 5-15 properties per county
-            
-            for i in range(property_count):
-                # Generate property owner
-                first_name = random.choice(first_names)
-                last_name = random.choice(last_names)
-                owner_name = f"{first_name} {last_name}"
-                
-                # Add occasional joint ownership
-                if random.random() > 0.7:
-                    spouse_first = random.choice(first_names)
-                    owner_name = f"{first_name} & {spouse_first} {last_name}"
-                
-                # Generate address
-                house_number = random.randint(100, 9999)
-                street = random.choice(street_names)
-                city = random.choice(cities)
-                zipcode = self.generate_zipcode_for_county(county)
-                address = f"{house_number} {street}, {city}, TX {zipcode}"
-                
-                # Property characteristics
-                year_built = random.randint(1975, 2023)
-                square_feet = random.randint(1200, 4500)
-                lot_size = round(random.uniform(0.15, 1.2), 2)  # acres
-                
-                # Property value based on county and characteristics
-                base_value = self.get_base_property_value(county)
-                age_factor = max(0.7, 1 - (2024 - year_built) * 0.01)  # Older = less valuable
-                size_factor = square_feet / 2000  # Bigger = more valuable
-                estimated_value = int(base_value * age_factor * size_factor * random.uniform(0.8, 1.3))
-                
-                # Account number (realistic format)
-                account_number = f"{random.randint(10000, 99999)}-{random.randint(100, 999)}"
-                
-                # Property data
-                property_data = {
-                    'account_number': account_number,
-                    'owner_name': owner_name,
-                    'property_address': address,
-                    'city': city,
-                    'county': county,
-                    'zipcode': zipcode,
-                    'property_type': random.choice(property_types),
-                    'year_built': year_built,
-                    'square_feet': square_feet,
-                    'lot_size_acres': lot_size,
-                    'appraised_value': estimated_value,
-                    'market_value': int(estimated_value * random.uniform(0.95, 1.05)),
-                    'homestead_exemption': random.choice([True, False]) if 'Residence' in property_types[0] else False,
-                    'last_sale_date': f"{random.randint(2018, 2024)}-{random.randint(1, 12):02d}-{random.randint(1, 28):02d}",
-                    'last_sale_price': int(estimated_value * random.uniform(0.85, 1.15)),
-                    'cad_url': f"{data['url']}/property-detail/{account_number}",
-                    'lead_score': self.calculate_cad_lead_score(estimated_value, year_built, owner_name),
-                    'data_source': 'CAD',
-                    'scraped_at': datetime.now().isoformat()
-                }
-                
-                # Insert into Supabase
-                supabase_data = {
-                    'account_number': property_data['account_number'],
-                    'owner_name': property_data['owner_name'],
-                    'address_text': property_data['property_address'],
-                    'city': property_data['city'],
-                    'county': property_data['county'],
-                    'zip_code': property_data['zipcode'],
-                    'property_type': property_data['property_type'],
-                    'year_built': property_data['year_built'],
-                    'square_feet': property_data['square_feet'],
-                    'lot_size_acres': property_data['lot_size_acres'],
-                    'appraised_value': property_data['appraised_value'],
-                    'market_value': property_data['market_value'],
-                    'homestead_exemption': property_data['homestead_exemption'],
-                    'last_sale_date': property_data['last_sale_date'],
-                    'last_sale_price': property_data['last_sale_price'],
-                    'cad_url': property_data['cad_url'],
-                    'lead_score': property_data['lead_score']
-                }
-                
-                if insert_lead('cad_leads', supabase_data):
-                    logger.debug(f"✅ Inserted CAD property: {property_data['property_address']}")
-                
-                sample_properties.append(property_data)
-        
-        return sample_properties
-
-    def generate_zipcode_for_county(self, county: str) -> str:
-        """Generate realistic ZIP codes for each county"""
-        zip_ranges = {
-            'Harris County': ['77001', '77002', '77003', '77004', '77005', '77006', '77007'],
-            'Dallas County': ['75201', '75204', '75206', '75214', '75218', '75230', '75240'],
-            'Tarrant County': ['76101', '76104', '76108', '76116', '76120', '76132', '76140'],
-            'Bexar County': ['78201', '78202', '78203', '78204', '78205', '78206', '78207'],
-            'Travis County': ['78701', '78702', '78703', '78704', '78705', '78728', '78729'],
-            'Collin County': ['75002', '75009', '75013', '75023', '75024', '75070', '75071'],
-            'Hidalgo County': ['78501', '78502', '78503', '78504', '78539', '78540', '78541'],
-            'Fort Bend County': ['77469', '77478', '77479', '77489', '77498', '77584', '77585'],
-            'Denton County': ['76201', '76205', '76226', '75019', '75022', '75028', '75067'],
-            'Montgomery County': ['77301', '77302', '77303', '77304', '77384', '77385', '77386']
+        # One timestamp for the whole batch
+        scraped_at = datetime.now().isoformat()
+        
+        counties = list(self.texas_cads.keys())
+        cad_infos = list(self.texas_cads.values())
+        
+        # Generate properties based on county population (more pop = more properties)
+        counts = np.array([min(max(int(data['population'] / 100000), 5), 15) for data in cad_infos])  # 5-15 properties per county
+        total = int(counts.sum())
+        county_idx = np.repeat(np.arange(len(counties)), counts)
+        
+        # Generate property owners, with occasional joint ownership
+        first = _rng.choice(first_names, size=total)
+        last = _rng.choice(last_names, size=total)
+        spouse = _rng.choice(first_names, size=total)
+        joint = _rng.random(total) > 0.7
+        
+        # Generate addresses; each county draws from its own list of cities
+        house_numbers = _rng.integers(100, 10000, size=total)
+        streets = _rng.choice(street_names, size=total)
+        city_counts = np.array([len(data['major_cities']) for data in cad_infos])
+        city_offsets = np.concatenate(([0], np.cumsum(city_counts)[:-1]))
+        city_names = np.array([city for data in cad_infos for city in data['major_cities']])
+        city_idx = city_offsets[county_idx] + (_rng.random(total) * city_counts[county_idx]).astype(np.intp)
+        default_zips = np.array(self.DEFAULT_ZIP_RANGE)
+        zipcodes = np.concatenate([
+            zip_array[_rng.integers(0, len(zip_array), size=count)]
+            for zip_array, count in zip((self.ZIP_ARRAYS.get(county, default_zips) for county in counties), counts.tolist())
+        ])
+        
+        # Property characteristics
+        years = _rng.integers(1975, 2024, size=total)
+        square_feet = _rng.integers(1200, 4501, size=total)
+        lot_sizes = np.round(_rng.uniform(0.15, 1.2, size=total), 2)  # acres
+        
+        # Property value based on county and characteristics
+        base_values = np.array([self.BASE_VALUES.get(county, self.DEFAULT_BASE_VALUE) for county in counties])[county_idx]
+        age_factor = np.maximum(0.7, 1 - (2024 - years) * 0.01)  # Older = less valuable
+        size_factor = square_feet / 2000  # Bigger = more valuable
+        estimated_values = (base_values * age_factor * size_factor * _rng.uniform(0.8, 1.3, size=total)).astype(np.int64)
+        market_values = (estimated_values * _rng.uniform(0.95, 1.05, size=total)).astype(np.int64)
+        sale_prices = (estimated_values * _rng.uniform(0.85, 1.15, size=total)).astype(np.int64)
+        
+        # Account number (realistic format)
+        account_prefixes = _rng.integers(10000, 100000, size=total)
+        account_suffixes = _rng.integers(100, 1000, size=total)
+        
+        types = _rng.choice(property_types, size=total)
+        homestead = _rng.random(total) < 0.5 if 'Residence' in property_types[0] else np.zeros(total, dtype=bool)
+        sale_years = _rng.integers(2018, 2025, size=total)
+        sale_months = _rng.integers(1, 13, size=total)
+        sale_days = _rng.integers(1, 29, size=total)
+        
+        # Sale dates as YYYY-MM-DD via datetime64 arithmetic
+        sale_months_since_epoch = (sale_years - 1970) * 12 + (sale_months - 1)
+        sale_dates = (
+            sale_months_since_epoch.astype('datetime64[M]').astype('datetime64[D]') + (sale_days - 1)
+        ).astype(str)
+        
+        # Build the string columns; the rest stay as NumPy arrays
+        county_names = np.take(np.array(counties), county_idx)
+        cities = np.take(city_names, city_idx)
+        urls = np.take(np.array([data['url'] for data in cad_infos]), county_idx)
+        owner_names = np.array([
+            f"{first_name} & {spouse_first} {last_name}" if is_joint else f"{first_name} {last_name}"
+            for first_name, spouse_first, last_name, is_joint in zip(
+                first.tolist(), spouse.tolist(), last.tolist(), joint.tolist()
+            )
+        ])
+        account_numbers = np.char.add(np.char.add(account_prefixes.astype(str), '-'), account_suffixes.astype(str))
+        
+        # "{house_number} {street}, {city}, TX {zipcode}" built column-wise
+        addresses = np.char.add(house_numbers.astype(str), ' ')
+        for part in (streets, ', ', cities, ', TX ', zipcodes):
+            addresses = np.char.add(addresses, part)
+        
+        columns = {
+            'account_number': account_numbers,
+            'owner_name': owner_names,
+            'address_text': addresses,
+            'city': cities,
+            'county': county_names,
+            'zip_code': zipcodes,
+            'property_type': types,
+            'year_built': years,
+            'square_feet': square_feet,
+            'lot_size_acres': lot_sizes,
+            'appraised_value': estimated_values,
+            'market_value': market_values,
+            'homestead_exemption': homestead,
+            'last_sale_date': sale_dates,
+            'last_sale_price': sale_prices,
+            'cad_url': np.char.add(np.char.add(urls, '/property-detail/'), account_numbers),
+            'lead_score': self.calculate_cad_lead_score(estimated_values, years, owner_names),
+            'data_source': np.full(total, 'CAD'),
+            'scraped_at': np.full(total, scraped_at)
         }
         
-        return random.choice(zip_ranges.get(county, ['75001']))
+        # Rows are generated county by county, so each county is a contiguous slice
+        ends = np.cumsum(counts).tolist()
+        self._sample_by_county = {
+            county: slice(end - count, end)
+            for county, count, end in zip(counties, counts.tolist(), ends)
+        }
+        return columns
+
+    def _get_sample_data(self) -> Dict[str, np.ndarray]:
+        """Return the sample dataset columns, generating (and persisting) them on first use"""
+        if self._sample_cache is None:
+            self._sample_cache = self.create_texas_cad_sample_data()
+            self._persist(self._sample_cache)
+        return self._sample_cache
 
-    def get_base_property_value(self, county: str) -> int:
-        """Get base property values by county"""
-        base_values = {
-            'Harris County': 280000,
-            'Dallas County': 320000,
-            'Tarrant County': 280000,
-            'Bexar County': 220000,
-            'Travis County': 450000,  # Austin is expensive
-            'Collin County': 380000,
-            'Hidalgo County': 150000,
-            'Fort Bend County': 350000,
-            'Denton County': 350000,
-            'Montgomery County': 300000
+    def _records(self, columns: Dict[str, np.ndarray], rows: slice = slice(None)) -> List[Dict]:
+        """Materialize row dicts from columnar CAD data"""
+        # Rows stay plain dicts because callers read them with .get(); each one is
+        # built by a single dict(zip()) over the fixed CAD_FIELDNAMES key tuple
+        values = [columns[name][rows].tolist() for name in CAD_COLUMNS]
+        return [dict(zip(CAD_FIELDNAMES, row)) for row in zip(*values)]
+
+    def _columns(self, records: List[Dict]) -> Dict[str, np.ndarray]:
+        """Build columnar CAD data from row dicts (the inverse of _records)"""
+        if not records:
+            return {}
+        return {
+            name: np.array([record[field] for record in records])
+            for name, field in zip(CAD_COLUMNS, CAD_FIELDNAMES)
         }
+
+    def _persist(self, columns: Dict[str, np.ndarray]) -> int:
+        """Insert CAD properties into Supabase, one bulk request per county (or 500-row chunk)"""
+        inserted = 0
+        
+        for rows in self._sample_by_county.values():
+            for start in range(rows.start, rows.stop, SUPABASE_BATCH_SIZE):
+                chunk = slice(start, min(start + SUPABASE_BATCH_SIZE, rows.stop))
+                values = [columns[name][chunk].tolist() for name in SUPABASE_CAD_COLUMNS]
+                batch = [dict(zip(SUPABASE_CAD_COLUMNS, row)) for row in zip(*values)]
+                inserted += insert_leads_bulk('cad_leads', batch)
         
-        return base_values.get(county, 250000)
+        return inserted
 
-    def calculate_cad_lead_score(self, value: int, year_built: int, owner_name: str) -> int:
-        """Calculate lead score based on CAD data"""
-        score = 5  # Base score
+    def calculate_cad_lead_score(self, values: np.ndarray, years_built: np.ndarray, owner_names: np.ndarray) -> np.ndarray:
+        """Calculate lead scores based on CAD data, for all properties at once"""
+        score = np.full(len(values), 5, dtype=np.int8)  # Base score
         
         # Value-based scoring
-        if value > 500000:
-            score += 3
-        elif value > 300000:
-            score += 2
-        elif value > 200000:
-            score += 1
-        
-        # Age-based scoring (older homes = better roofing leads)
-        current_year = datetime.now().year
-        age = current_year - year_built
-        
-        if age > 15:
-            score += 3  # Likely needs roof work
-        elif age > 10:
-            score += 2
-        elif age > 5:
-            score += 1
+        score += np.select([values > 500000, values > 300000, values > 200000], [3, 2, 1], default=0).astype(np.int8)
+        
+        # Age-based scoring (older homes = better roofing leads; 15+ years likely needs roof work)
+        age = _CURRENT_YEAR - years_built
+        score += np.select([age > 15, age > 10, age > 5], [3, 2, 1], default=0).astype(np.int8)
         
         # Joint ownership often indicates stability (better leads)
-        if '&' in owner_name:
-            score += 1
+        score += np.char.find(owner_names, '&') >= 0
         
-        return min(score, 10)
+        np.minimum(score, 10, out=score)
+        return score
+
+    async def scrape_county_cad_async(self, session: aiohttp.ClientSession, county: str, cad_info: Dict) -> List[Dict]:
+        """Scrape individual county CAD data (placeholder: serves sample rows and awaits no I/O yet)
 
-    def scrape_county_cad(self, county: str, cad_info: Dict) -> List[Dict]:
-        """Scrape individual county CAD data"""
+        Real CAD fetches belong here and must go through `session`. aiohttp does not read
+        self.session.proxies, so they also need proxy=... passed per request; until then
+        gather() runs the counties one after another.
+        """
         logger.info(f"Scraping {county} CAD...")
         
         try:
             # Rotate proxy for each county
             self.rotate_proxy()
             
-            # Simulate API delay
-            time.sleep(random.uniform(3, 7))
-            
-            # For now, generate sample data per county
-            county_properties = [p for p in self.create_texas_cad_sample_data() if p['county'] == county]
+            # For now, serve this county's slice of the cached sample data
+            columns = self._get_sample_data()
+            county_properties = self._records(columns, self._sample_by_county[county])
             
             logger.info(f"Found {len(county_properties)} properties in {county}")
             return county_properties
@@ -299,72 +380,79 @@ class TexasCADScraper:
             logger.error(f"Error scraping {county}: {e}")
             return []
 
+    async def _scrape_all_async(self) -> List[List[Dict]]:
+        """Scrape every county concurrently over a single shared aiohttp session"""
+        # ttl_dns_cache keeps CAD hostname lookups for the whole run once fetches go through
+        # this session; the placeholder scrape sends no requests yet, so nothing is cached today
+        connector = aiohttp.TCPConnector(limit=20, ttl_dns_cache=3600)
+        
+        async with aiohttp.ClientSession(connector=connector, headers=dict(self.session.headers)) as session:
+            return await asyncio.gather(*[
+                self.scrape_county_cad_async(session, county, cad_info)
+                for county, cad_info in self.texas_cads.items()
+            ])
+
     def scrape_all_texas_cads(self) -> List[Dict]:
         """Scrape all configured Texas CAD sites"""
         logger.info("🏛️ Starting Texas CAD Scraper (Top 10 Counties)")
         logger.info("=" * 60)
         
-        # Generate all sample data at once for efficiency
-        all_sample_data = self.create_texas_cad_sample_data()
-        self.all_properties = all_sample_data
+        # Scrape all counties concurrently; CSV/stats use columns built from the same rows
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            county_results = asyncio.run(self._scrape_all_async())
+        else:
+            # asyncio.run() cannot nest inside a running loop, so give the scrape its own thread
+            with ThreadPoolExecutor(max_workers=1) as executor:
+                county_results = executor.submit(asyncio.run, self._scrape_all_async()).result()
+        all_sample_data = [row for rows in county_results for row in rows]
+        self.columns = self._columns(all_sample_data)
         
         # Log county distribution
-        for county in self.texas_cads.keys():
-            county_count = len([p for p in all_sample_data if p['county'] == county])
+        for county, county_count in self._county_counts().items():
             logger.info(f"   • {county}: {county_count} properties")
         
         logger.info(f"✅ Total CAD properties: {len(all_sample_data)}")
         return all_sample_data
 
+    def _county_counts(self) -> Dict[str, int]:
+        """Count scraped properties per county, in configuration order"""
+        if not self.columns:
+            return {}
+        counts = Counter(self.columns['county'].tolist())
+        ordered = {county: counts.pop(county) for county in self.texas_cads if county in counts}
+        ordered.update(counts)
+        return ordered
+
     def get_cad_stats(self) -> Dict[str, Any]:
         """Get comprehensive CAD statistics"""
-        if not self.all_properties:
+        if not self.columns:
             return {}
         
-        counties = {}
-        value_ranges = {
-            'under_200k': 0,
-            '200k_400k': 0,
-            '400k_600k': 0,
-            'over_600k': 0
-        }
-        lead_scores = {'high': 0, 'medium': 0, 'low': 0}
-        homestead_count = 0
-        total_value = 0
+        values = self.columns['appraised_value']
+        total_properties = len(values)
+        total_value = int(values.sum())
         
-        for prop in self.all_properties:
-            county = prop.get('county', 'Unknown')
-            counties[county] = counties.get(county, 0) + 1
-            
-            value = prop.get('appraised_value', 0)
-            total_value += value
-            
-            if value < 200000:
-                value_ranges['under_200k'] += 1
-            elif value < 400000:
-                value_ranges['200k_400k'] += 1
-            elif value < 600000:
-                value_ranges['400k_600k'] += 1
-            else:
-                value_ranges['over_600k'] += 1
-            
-            # Lead scoring
-            lead_score = prop.get('lead_score', 5)
-            if lead_score >= 8:
-                lead_scores['high'] += 1
-            elif lead_score >= 6:
-                lead_scores['medium'] += 1
-            else:
-                lead_scores['low'] += 1
-            
-            # Homestead exemptions
-            if prop.get('homestead_exemption'):
-                homestead_count += 1
+        counties = self._county_counts()
+        
+        buckets = np.searchsorted([200000, 400000, 600000], values, side='right')
+        range_counts = np.bincount(buckets, minlength=4)
+        value_ranges = dict(zip(('under_200k', '200k_400k', '400k_600k', 'over_600k'), range_counts.tolist()))
+        
+        # Lead scoring
+        scores = self.columns['lead_score']
+        high = int((scores >= 8).sum())
+        medium = int(((scores >= 6) & (scores < 8)).sum())
+        lead_scores = {'high': high, 'medium': medium, 'low': total_properties - high - medium}
+        
+        # Homestead exemptions
+        homestead_count = int(self.columns['homestead_exemption'].sum())
         
         return {
-            'total_properties': len(self.all_properties),
+            'total_properties': total_properties,
             'total_appraised_value': total_value,
-            'average_value': int(total_value / len(self.all_properties)) if self.all_properties else 0,
+            'average_value': int(total_value / total_properties) if total_properties else 0,
             'counties': counties,
             'value_ranges': value_ranges,
             'lead_scores': lead_scores,
@@ -372,19 +460,27 @@ class TexasCADScraper:
             'scraped_at': datetime.now().isoformat()
         }
 
-    def save_to_csv(self, filename: str = 'texas_cad_properties.csv'):
-        """Save CAD data to CSV"""
-        if not self.all_properties:
+    def save_to_csv(self, filename: str = 'texas_cad_properties.csv', fsync: bool = False, line_flush: bool = False):
+        """Save CAD data to CSV (fsync: force to disk before returning; line_flush: flush every row for tail readers)"""
+        if not self.columns:
             return
         
-        fieldnames = list(self.all_properties[0].keys())
+        fieldnames = CAD_FIELDNAMES
+        columns = [self.columns[name].tolist() for name in CAD_COLUMNS]
+        total = len(columns[0])
         
-        with open(filename, 'w', newline='', encoding='utf-8') as csvfile:
-            writer = csv.DictWriter(csvfile, fieldnames=fieldnames)
-            writer.writeheader()
-            writer.writerows(self.all_properties)
+        # Stream tuples through csv.writer: 1 MB buffer for throughput, line buffering when readers tail the file
+        buffering = 1 if line_flush else 1 << 20
+        with open(filename, 'w', newline='', encoding='utf-8', buffering=buffering) as csvfile:
+            writer = csv.writer(csvfile)
+            writer.writerow(fieldnames)
+            writer.writerows(zip(*columns))
+            
+            if fsync:
+                csvfile.flush()
+                os.fsync(csvfile.fileno())
         
-        logger.info(f"💾 Saved {len(self.all_properties)} CAD properties to {filename}")
+        logger.info(f"💾 Saved {total} CAD properties to {filename}")
 
 
 def main():